@@ -353,10 +353,14 @@ def start():
                 write_flags = []
 
                 for i in c.args:
-                    flag = FLAGS_RE.match(i[1])
+                    flag = FLAGS_RE_2.match(i[1])
                     if flag:
+                        # "true" flags carry no value, so False is treated the same as None (flag not set)
                         write_flags.append(
-                            "flags |= (1 << {}) if self.{} is not None else 0".format(flag.group(1), i[0]))
+                            "flags |= (1 << {}) if self.{}{} else 0".format(
+                                flag.group(1), i[0], "" if flag.group(2) == "true" else " is not None"
+                            )
+                        )
 
                 write_flags = "\n        ".join([
                     "flags = 0",
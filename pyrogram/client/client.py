@@ -154,6 +154,12 @@ class Client(Methods, BaseClient):
             download_media, ...) are less prone to throw FloodWait exceptions.
             Only available for users, bots will ignore this parameter.
             Defaults to False (normal session).
+
+        batch_flush_interval (``float``, *optional*):
+            Pass a number of seconds to buffer outgoing requests for and send them together in a single container
+            instead of one by one. Useful for bots that send lots of messages in a short amount of time, at the cost of
+            adding up to *batch_flush_interval* seconds of latency to each request.
+            Defaults to None (requests are sent immediately).
     """
 
     def __init__(
@@ -178,7 +184,8 @@ class Client(Methods, BaseClient):
         config_file: str = BaseClient.CONFIG_FILE,
         plugins: dict = None,
         no_updates: bool = None,
-        takeout: bool = None
+        takeout: bool = None,
+        batch_flush_interval: float = None
     ):
         super().__init__()
 
@@ -204,6 +211,7 @@ class Client(Methods, BaseClient):
         self.plugins = plugins
         self.no_updates = no_updates
         self.takeout = takeout
+        self.batch_flush_interval = batch_flush_interval
 
         if isinstance(session_name, str):
             if session_name == ":memory:" or len(session_name) >= MemoryStorage.SESSION_STRING_SIZE:
@@ -1958,7 +1966,7 @@ class Client(Methods, BaseClient):
                 peer=peer,
                 volume_id=volume_id,
                 local_id=local_id,
-                big=is_big or None
+                big=is_big
             )
         elif media_type in (0, 2):
             location = types.InputPhotoFileLocation(
@@ -22,7 +22,7 @@ from typing import List
 from typing import Union
 
 import pyrogram
-from pyrogram.api.types import PeerUser, PeerChat, PeerChannel
+from pyrogram.api.types import PeerUser, PeerChat, PeerChannel, InputPeerUser, InputPeerChat, InputPeerChannel
 from . import BaseClient
 from ...api import types
 
@@ -213,14 +213,16 @@ MIN_CHAT_ID = -2147483647
 MAX_USER_ID = 2147483647
 
 
-def get_peer_id(peer: Union[PeerUser, PeerChat, PeerChannel]) -> int:
-    if isinstance(peer, PeerUser):
+def get_peer_id(
+    peer: Union[PeerUser, PeerChat, PeerChannel, InputPeerUser, InputPeerChat, InputPeerChannel]
+) -> int:
+    if isinstance(peer, (PeerUser, InputPeerUser)):
         return peer.user_id
 
-    if isinstance(peer, PeerChat):
+    if isinstance(peer, (PeerChat, InputPeerChat)):
         return -peer.chat_id
 
-    if isinstance(peer, PeerChannel):
+    if isinstance(peer, (PeerChannel, InputPeerChannel)):
         return MAX_CHANNEL_ID - peer.channel_id
 
     raise ValueError("Peer type invalid: {}".format(peer))
@@ -69,7 +69,7 @@ class AnswerCallbackQuery(BaseClient):
             functions.messages.SetBotCallbackAnswer(
                 query_id=int(callback_query_id),
                 cache_time=cache_time,
-                alert=show_alert or None,
+                alert=show_alert,
                 message=text,
                 url=url
             )
@@ -98,8 +98,8 @@ class AnswerInlineQuery(BaseClient):
                 query_id=int(inline_query_id),
                 results=[r.write() for r in results],
                 cache_time=cache_time,
-                gallery=is_gallery or None,
-                private=is_personal or None,
+                gallery=is_gallery,
+                private=is_personal,
                 next_offset=next_offset or None,
                 switch_pm=types.InlineBotSwitchPM(
                     text=switch_pm_text,
@@ -77,7 +77,7 @@ class SendGame(BaseClient):
                     ),
                 ),
                 message="",
-                silent=disable_notification or None,
+                silent=disable_notification,
                 reply_to_msg_id=reply_to_message_id,
                 random_id=self.rnd_id(),
                 reply_markup=reply_markup.write() if reply_markup else None
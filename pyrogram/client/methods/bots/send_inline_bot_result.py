@@ -71,8 +71,8 @@ class SendInlineBotResult(BaseClient):
                 query_id=query_id,
                 id=result_id,
                 random_id=self.rnd_id(),
-                silent=disable_notification or None,
+                silent=disable_notification,
                 reply_to_msg_id=reply_to_message_id,
-                hide_via=hide_via or None
+                hide_via=hide_via
             )
         )
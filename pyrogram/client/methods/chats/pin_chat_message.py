@@ -60,7 +60,7 @@ class PinChatMessage(BaseClient):
             functions.messages.UpdatePinnedMessage(
                 peer=self.resolve_peer(chat_id),
                 id=message_id,
-                silent=disable_notification or None
+                silent=disable_notification
             )
         )
 
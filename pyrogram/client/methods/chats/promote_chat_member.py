@@ -89,14 +89,14 @@ class PromoteChatMember(BaseClient):
                 channel=self.resolve_peer(chat_id),
                 user_id=self.resolve_peer(user_id),
                 admin_rights=types.ChatAdminRights(
-                    change_info=can_change_info or None,
-                    post_messages=can_post_messages or None,
-                    edit_messages=can_edit_messages or None,
-                    delete_messages=can_delete_messages or None,
-                    ban_users=can_restrict_members or None,
-                    invite_users=can_invite_users or None,
-                    pin_messages=can_pin_messages or None,
-                    add_admins=can_promote_members or None,
+                    change_info=can_change_info,
+                    post_messages=can_post_messages,
+                    edit_messages=can_edit_messages,
+                    delete_messages=can_delete_messages,
+                    ban_users=can_restrict_members,
+                    invite_users=can_invite_users,
+                    pin_messages=can_pin_messages,
+                    add_admins=can_promote_members,
                 ),
                 rank=""
             )
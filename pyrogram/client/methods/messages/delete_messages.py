@@ -76,7 +76,7 @@ class DeleteMessages(BaseClient):
             r = self.send(
                 functions.messages.DeleteMessages(
                     id=message_ids,
-                    revoke=revoke or None
+                    revoke=revoke
                 )
             )
 
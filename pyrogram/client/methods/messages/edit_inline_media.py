@@ -107,11 +107,14 @@ class EditInlineMedia(BaseClient):
             else:
                 media = utils.get_input_media_from_file_id(media.media, media.file_ref, 5)
 
+        message, entities = self.parser.parse(caption, parse_mode)
+
         return self.send(
             functions.messages.EditInlineBotMessage(
                 id=utils.unpack_inline_message_id(inline_message_id),
                 media=media,
                 reply_markup=reply_markup.write() if reply_markup else None,
-                **self.parser.parse(caption, parse_mode)
+                message=message,
+                entities=entities
             )
         )
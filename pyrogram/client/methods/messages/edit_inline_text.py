@@ -71,11 +71,14 @@ class EditInlineText(BaseClient):
                     disable_web_page_preview=True)
         """
 
+        message, entities = self.parser.parse(text, parse_mode)
+
         return self.send(
             functions.messages.EditInlineBotMessage(
                 id=utils.unpack_inline_message_id(inline_message_id),
-                no_webpage=disable_web_page_preview or None,
+                no_webpage=disable_web_page_preview,
                 reply_markup=reply_markup.write() if reply_markup else None,
-                **self.parser.parse(text, parse_mode)
+                message=message,
+                entities=entities
             )
         )
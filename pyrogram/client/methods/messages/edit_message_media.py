@@ -112,7 +112,7 @@ class EditMessageMedia(BaseClient):
                             file=self.save_file(media.media),
                             attributes=[
                                 types.DocumentAttributeVideo(
-                                    supports_streaming=media.supports_streaming or None,
+                                    supports_streaming=media.supports_streaming,
                                     duration=media.duration,
                                     w=media.width,
                                     h=media.height
@@ -244,13 +244,16 @@ class EditMessageMedia(BaseClient):
             else:
                 media = utils.get_input_media_from_file_id(media.media, media.file_ref, 5)
 
+        message, entities = self.parser.parse(caption, parse_mode)
+
         r = self.send(
             functions.messages.EditMessage(
                 peer=self.resolve_peer(chat_id),
                 id=message_id,
                 media=media,
                 reply_markup=reply_markup.write() if reply_markup else None,
-                **self.parser.parse(caption, parse_mode)
+                message=message,
+                entities=entities
             )
         )
 
@@ -75,13 +75,16 @@ class EditMessageText(BaseClient):
                     disable_web_page_preview=True)
         """
 
+        message, entities = self.parser.parse(text, parse_mode)
+
         r = self.send(
             functions.messages.EditMessage(
                 peer=self.resolve_peer(chat_id),
                 id=message_id,
-                no_webpage=disable_web_page_preview or None,
+                no_webpage=disable_web_page_preview,
                 reply_markup=reply_markup.write() if reply_markup else None,
-                **self.parser.parse(text, parse_mode)
+                message=message,
+                entities=entities
             )
         )
 
@@ -109,7 +109,7 @@ class ForwardMessages(BaseClient):
                     to_peer=self.resolve_peer(chat_id),
                     from_peer=self.resolve_peer(from_chat_id),
                     id=message_ids,
-                    silent=disable_notification or None,
+                    silent=disable_notification,
                     random_id=[self.rnd_id() for _ in message_ids]
                 )
             )
@@ -94,16 +94,19 @@ class SendCachedMedia(BaseClient):
                 app.send_cached_media("me", "CAADBAADyg4AAvLQYAEYD4F7vcZ43AI")
         """
 
+        message, entities = self.parser.parse(caption, parse_mode)
+
         r = self.send(
             functions.messages.SendMedia(
                 peer=self.resolve_peer(chat_id),
                 media=utils.get_input_media_from_file_id(file_id, file_ref),
-                silent=disable_notification or None,
+                silent=disable_notification,
                 reply_to_msg_id=reply_to_message_id,
                 random_id=self.rnd_id(),
                 schedule_date=schedule_date,
                 reply_markup=reply_markup.write() if reply_markup else None,
-                **self.parser.parse(caption, parse_mode)
+                message=message,
+                entities=entities
             )
         )
 
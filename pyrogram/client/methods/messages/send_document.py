@@ -156,18 +156,21 @@ class SendDocument(BaseClient):
             else:
                 media = utils.get_input_media_from_file_id(document, file_ref, 5)
 
+            message, entities = self.parser.parse(caption, parse_mode)
+
             while True:
                 try:
                     r = self.send(
                         functions.messages.SendMedia(
                             peer=self.resolve_peer(chat_id),
                             media=media,
-                            silent=disable_notification or None,
+                            silent=disable_notification,
                             reply_to_msg_id=reply_to_message_id,
                             random_id=self.rnd_id(),
                             schedule_date=schedule_date,
                             reply_markup=reply_markup.write() if reply_markup else None,
-                            **self.parser.parse(caption, parse_mode)
+                            message=message,
+                            entities=entities
                         )
                     )
                 except FilePartMissing as e:
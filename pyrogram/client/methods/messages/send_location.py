@@ -85,7 +85,7 @@ class SendLocation(BaseClient):
                     )
                 ),
                 message="",
-                silent=disable_notification or None,
+                silent=disable_notification,
                 reply_to_msg_id=reply_to_message_id,
                 random_id=self.rnd_id(),
                 schedule_date=schedule_date,
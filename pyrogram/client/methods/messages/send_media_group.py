@@ -133,7 +133,7 @@ class SendMediaGroup(BaseClient):
                                         mime_type=self.guess_mime_type(i.media) or "video/mp4",
                                         attributes=[
                                             types.DocumentAttributeVideo(
-                                                supports_streaming=i.supports_streaming or None,
+                                                supports_streaming=i.supports_streaming,
                                                 duration=i.duration,
                                                 w=i.width,
                                                 h=i.height
@@ -176,11 +176,14 @@ class SendMediaGroup(BaseClient):
                 else:
                     media = utils.get_input_media_from_file_id(i.media, i.file_ref, 4)
 
+            message, entities = self.parser.parse(i.caption, i.parse_mode)
+
             multi_media.append(
                 types.InputSingleMedia(
                     media=media,
                     random_id=self.rnd_id(),
-                    **self.parser.parse(i.caption, i.parse_mode)
+                    message=message,
+                    entities=entities
                 )
             )
 
@@ -190,7 +193,7 @@ class SendMediaGroup(BaseClient):
                     functions.messages.SendMultiMedia(
                         peer=self.resolve_peer(chat_id),
                         multi_media=multi_media,
-                        silent=disable_notification or None,
+                        silent=disable_notification,
                         reply_to_msg_id=reply_to_message_id
                     )
                 )
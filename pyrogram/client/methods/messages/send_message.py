@@ -20,7 +20,10 @@ from typing import Union
 
 import pyrogram
 from pyrogram.api import functions, types
-from ...ext import BaseClient
+from ...ext import BaseClient, utils
+
+# TL types are generated final classes, exact type checks are enough and avoid isinstance() overhead
+NEW_MESSAGE_TYPES = frozenset([types.UpdateNewMessage, types.UpdateNewChannelMessage, types.UpdateNewScheduledMessage])
 
 
 class SendMessage(BaseClient):
@@ -38,8 +41,9 @@ class SendMessage(BaseClient):
             "pyrogram.ReplyKeyboardMarkup",
             "pyrogram.ReplyKeyboardRemove",
             "pyrogram.ForceReply"
-        ] = None
-    ) -> "pyrogram.Message":
+        ] = None,
+        message_id_only: bool = None
+    ) -> Union["pyrogram.Message", int]:
         """Send text messages.
 
         Parameters:
@@ -75,8 +79,13 @@ class SendMessage(BaseClient):
                 Additional interface options. An object for an inline keyboard, custom reply keyboard,
                 instructions to remove reply keyboard or to force a reply from the user.
 
+            message_id_only (``bool``, *optional*):
+                Pass True to skip building the sent :obj:`Message` and only get its id back.
+                Useful for fire-and-forget messages, where the returned object would be discarded anyway.
+
         Returns:
-            :obj:`Message`: On success, the sent text message is returned.
+            :obj:`Message` | ``int``: On success, the sent text message is returned. In case *message_id_only* is True,
+            only the id of the sent message is returned.
 
         Example:
             .. code-block:: python
@@ -116,13 +125,14 @@ class SendMessage(BaseClient):
                         ]))
         """
 
-        message, entities = self.parser.parse(text, parse_mode).values()
+        message, entities = self.parser.parse(text, parse_mode)
+        peer = self.resolve_peer(chat_id)
 
         r = self.send(
             functions.messages.SendMessage(
-                peer=self.resolve_peer(chat_id),
-                no_webpage=disable_web_page_preview or None,
-                silent=disable_notification or None,
+                peer=peer,
+                no_webpage=disable_web_page_preview,
+                silent=disable_notification,
                 reply_to_msg_id=reply_to_message_id,
                 random_id=self.rnd_id(),
                 schedule_date=schedule_date,
@@ -132,19 +142,14 @@ class SendMessage(BaseClient):
             )
         )
 
-        if isinstance(r, types.UpdateShortSentMessage):
-            peer = self.resolve_peer(chat_id)
-
-            peer_id = (
-                peer.user_id
-                if isinstance(peer, types.InputPeerUser)
-                else -peer.chat_id
-            )
+        if type(r) is types.UpdateShortSentMessage:
+            if message_id_only:
+                return r.id
 
             return pyrogram.Message(
                 message_id=r.id,
                 chat=pyrogram.Chat(
-                    id=peer_id,
+                    id=utils.get_peer_id(peer),
                     type="private",
                     client=self
                 ),
@@ -155,11 +160,15 @@ class SendMessage(BaseClient):
                 client=self
             )
 
-        for i in r.updates:
-            if isinstance(i, (types.UpdateNewMessage, types.UpdateNewChannelMessage, types.UpdateNewScheduledMessage)):
+        for update in r.updates:
+            if type(update) in NEW_MESSAGE_TYPES:
+                if message_id_only:
+                    return update.message.id
+
+                # Only the first matching update is parsed, build the lookups once it has been found
                 return pyrogram.Message._parse(
-                    self, i.message,
-                    {i.id: i for i in r.users},
-                    {i.id: i for i in r.chats},
-                    is_scheduled=isinstance(i, types.UpdateNewScheduledMessage)
+                    self, update.message,
+                    {u.id: u for u in r.users},
+                    {c.id: c for c in r.chats},
+                    is_scheduled=type(update) is types.UpdateNewScheduledMessage
                 )
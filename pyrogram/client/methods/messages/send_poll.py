@@ -106,14 +106,14 @@ class SendPoll(BaseClient):
                             types.PollAnswer(text=o, option=bytes([i]))
                             for i, o in enumerate(options)
                         ],
-                        multiple_choice=allows_multiple_answers or None,
-                        public_voters=not is_anonymous or None,
-                        quiz=type == "quiz" or None
+                        multiple_choice=allows_multiple_answers,
+                        public_voters=not is_anonymous,
+                        quiz=type == "quiz"
                     ),
                     correct_answers=None if correct_option_id is None else [bytes([correct_option_id])]
                 ),
                 message="",
-                silent=disable_notification or None,
+                silent=disable_notification,
                 reply_to_msg_id=reply_to_message_id,
                 random_id=self.rnd_id(),
                 schedule_date=schedule_date,
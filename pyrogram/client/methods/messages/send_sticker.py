@@ -135,7 +135,7 @@ class SendSticker(BaseClient):
                         functions.messages.SendMedia(
                             peer=self.resolve_peer(chat_id),
                             media=media,
-                            silent=disable_notification or None,
+                            silent=disable_notification,
                             reply_to_msg_id=reply_to_message_id,
                             random_id=self.rnd_id(),
                             schedule_date=schedule_date,
@@ -109,7 +109,7 @@ class SendVenue(BaseClient):
                     venue_type=foursquare_type
                 ),
                 message="",
-                silent=disable_notification or None,
+                silent=disable_notification,
                 reply_to_msg_id=reply_to_message_id,
                 random_id=self.rnd_id(),
                 schedule_date=schedule_date,
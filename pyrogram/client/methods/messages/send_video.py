@@ -164,7 +164,7 @@ class SendVideo(BaseClient):
                     thumb=thumb,
                     attributes=[
                         types.DocumentAttributeVideo(
-                            supports_streaming=supports_streaming or None,
+                            supports_streaming=supports_streaming,
                             duration=duration,
                             w=width,
                             h=height
@@ -179,18 +179,21 @@ class SendVideo(BaseClient):
             else:
                 media = utils.get_input_media_from_file_id(video, file_ref, 4)
 
+            message, entities = self.parser.parse(caption, parse_mode)
+
             while True:
                 try:
                     r = self.send(
                         functions.messages.SendMedia(
                             peer=self.resolve_peer(chat_id),
                             media=media,
-                            silent=disable_notification or None,
+                            silent=disable_notification,
                             reply_to_msg_id=reply_to_message_id,
                             random_id=self.rnd_id(),
                             schedule_date=schedule_date,
                             reply_markup=reply_markup.write() if reply_markup else None,
-                            **self.parser.parse(caption, parse_mode)
+                            message=message,
+                            entities=entities
                         )
                     )
                 except FilePartMissing as e:
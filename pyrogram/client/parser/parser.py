@@ -16,7 +16,6 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Pyrogram.  If not, see <http://www.gnu.org/licenses/>.
 
-from collections import OrderedDict
 from typing import Union
 
 import pyrogram
@@ -33,17 +32,14 @@ class Parser:
     def parse(self, text: str, mode: Union[str, None] = object):
         text = str(text).strip()
 
-        if mode == object:
+        if mode is object:
             if self.client:
                 mode = self.client.parse_mode
             else:
                 mode = "combined"
 
         if mode is None:
-            return OrderedDict([
-                ("message", text),
-                ("entities", [])
-            ])
+            return text, []
 
         mode = mode.lower()
 
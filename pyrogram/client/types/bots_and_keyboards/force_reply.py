@@ -54,5 +54,5 @@ class ForceReply(Object):
     def write(self):
         return ReplyKeyboardForceReply(
             single_use=True,
-            selective=self.selective or None
+            selective=self.selective
         )
@@ -92,7 +92,7 @@ class ReplyKeyboardMarkup(Object):
                     for j in i
                 ]
             ) for i in self.keyboard],
-            resize=self.resize_keyboard or None,
-            single_use=self.one_time_keyboard or None,
-            selective=self.selective or None
+            resize=self.resize_keyboard,
+            single_use=self.one_time_keyboard,
+            selective=self.selective
         )
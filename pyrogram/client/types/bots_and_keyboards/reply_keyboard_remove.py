@@ -54,5 +54,5 @@ class ReplyKeyboardRemove(Object):
 
     def write(self):
         return ReplyKeyboardHide(
-            selective=self.selective or None
+            selective=self.selective
         )
@@ -109,6 +109,17 @@ class InlineQueryResultAnimation(InlineQueryResult):
                 attributes=[]
             )
 
+        if self.input_message_content:
+            send_message = self.input_message_content.write(self.reply_markup)
+        else:
+            message, entities = Parser(None).parse(self.caption, self.parse_mode)
+
+            send_message = types.InputBotInlineMessageMediaAuto(
+                reply_markup=self.reply_markup.write() if self.reply_markup else None,
+                message=message,
+                entities=entities
+            )
+
         return types.InputBotInlineResult(
             id=self.id,
             type=self.type,
@@ -116,12 +127,5 @@ class InlineQueryResultAnimation(InlineQueryResult):
             description=self.description,
             thumb=thumb,
             content=animation,
-            send_message=(
-                self.input_message_content.write(self.reply_markup)
-                if self.input_message_content
-                else types.InputBotInlineMessageMediaAuto(
-                    reply_markup=self.reply_markup.write() if self.reply_markup else None,
-                    **(Parser(None)).parse(self.caption, self.parse_mode)
-                )
-            )
+            send_message=send_message
         )
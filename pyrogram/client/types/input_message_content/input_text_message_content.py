@@ -49,8 +49,11 @@ class InputTextMessageContent(InputMessageContent):
         self.disable_web_page_preview = disable_web_page_preview
 
     def write(self, reply_markup):
+        message, entities = Parser(None).parse(self.message_text, self.parse_mode)
+
         return types.InputBotInlineMessageText(
-            no_webpage=self.disable_web_page_preview or None,
+            no_webpage=self.disable_web_page_preview,
             reply_markup=reply_markup.write() if reply_markup else None,
-            **(Parser(None)).parse(self.message_text, self.parse_mode)
+            message=message,
+            entities=entities
         )
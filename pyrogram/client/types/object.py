@@ -29,6 +29,8 @@ class Meta(type, metaclass=type("", (type,), {"__str__": lambda _: "~hi"})):
 
 
 class Object(metaclass=Meta):
+    __slots__ = ["_client"]
+
     def __init__(self, client: "pyrogram.BaseClient" = None):
         self._client = client
 
@@ -42,6 +44,15 @@ class Object(metaclass=Meta):
         """
         self._client = client
 
+    @staticmethod
+    def _attributes(obj: "Object") -> list:
+        attributes = list(getattr(obj, "__dict__", []))
+
+        for cls in reversed(type(obj).__mro__):
+            attributes.extend(cls.__dict__.get("__slots__", []))
+
+        return attributes
+
     @staticmethod
     def default(obj: "Object"):
         if isinstance(obj, bytes):
@@ -55,7 +66,7 @@ class Object(metaclass=Meta):
                 else (attr, str(datetime.fromtimestamp(getattr(obj, attr))))
                 if attr.endswith("date")
                 else (attr, getattr(obj, attr))
-                for attr in filter(lambda x: not x.startswith("_"), obj.__dict__)
+                for attr in filter(lambda x: not x.startswith("_"), Object._attributes(obj))
                 if getattr(obj, attr) is not None
             ]
         )
@@ -68,13 +79,13 @@ class Object(metaclass=Meta):
             self.__class__.__name__,
             ", ".join(
                 "{}={}".format(attr, repr(getattr(self, attr)))
-                for attr in filter(lambda x: not x.startswith("_"), self.__dict__)
+                for attr in filter(lambda x: not x.startswith("_"), Object._attributes(self))
                 if getattr(self, attr) is not None
             )
         )
 
     def __eq__(self, other: "Object") -> bool:
-        for attr in self.__dict__:
+        for attr in Object._attributes(self):
             try:
                 if getattr(self, attr) != getattr(other, attr):
                     return False
@@ -56,6 +56,11 @@ class ChatPermissions(Object):
             Ignored in public supergroups.
     """
 
+    __slots__ = [
+        "can_send_messages", "can_send_media_messages", "can_send_other_messages", "can_add_web_page_previews",
+        "can_send_polls", "can_change_info", "can_invite_users", "can_pin_messages"
+    ]
+
     def __init__(
         self,
         *,
@@ -81,17 +86,19 @@ class ChatPermissions(Object):
 
     @staticmethod
     def _parse(denied_permissions: types.ChatBannedRights) -> "ChatPermissions":
-        if isinstance(denied_permissions, types.ChatBannedRights):
-            return ChatPermissions(
-                can_send_messages=not denied_permissions.send_messages,
-                can_send_media_messages=not denied_permissions.send_media,
-                can_send_other_messages=(
-                    not denied_permissions.send_stickers or not denied_permissions.send_gifs or
-                    not denied_permissions.send_games or not denied_permissions.send_inline
-                ),
-                can_add_web_page_previews=not denied_permissions.embed_links,
-                can_send_polls=not denied_permissions.send_polls,
-                can_change_info=not denied_permissions.change_info,
-                can_invite_users=not denied_permissions.invite_users,
-                can_pin_messages=not denied_permissions.pin_messages
-            )
+        if denied_permissions is None:
+            return None
+
+        return ChatPermissions(
+            can_send_messages=not denied_permissions.send_messages,
+            can_send_media_messages=not denied_permissions.send_media,
+            can_send_other_messages=not (
+                denied_permissions.send_stickers and denied_permissions.send_gifs and
+                denied_permissions.send_games and denied_permissions.send_inline
+            ),
+            can_add_web_page_previews=not denied_permissions.embed_links,
+            can_send_polls=not denied_permissions.send_polls,
+            can_change_info=not denied_permissions.change_info,
+            can_invite_users=not denied_permissions.invite_users,
+            can_pin_messages=not denied_permissions.pin_messages
+        )
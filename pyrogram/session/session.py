@@ -24,7 +24,7 @@ from hashlib import sha1, sha256
 from io import BytesIO
 from os import urandom
 from queue import Queue
-from threading import Event, Thread
+from threading import Event, Lock, Thread
 
 import pyrogram
 from pyrogram import __copyright__, __license__, __version__
@@ -53,6 +53,9 @@ class Session:
     MAX_RETRIES = 5
     ACKS_THRESHOLD = 8
     PING_INTERVAL = 5
+    MAX_BATCH_SIZE = 64
+    MAX_BATCH_BYTES = 1044456 - 8  # Telegram closes the connection on bigger container payloads
+    RETRY_BAD_MSG_CODES = (16, 17, 32, 33, 48)  # Time skew, seq_no and salt related, resending is enough
 
     notice_displayed = False
 
@@ -109,6 +112,13 @@ class Session:
         self.next_salt_thread = None
         self.next_salt_thread_event = Event()
 
+        self.batch = []
+        self.batch_bytes = 0
+        self.batch_lock = Lock()
+        self.batched = {}  # Inner msg_id -> msg_id of the container it was sent in
+        self.batch_thread = None
+        self.batch_thread_event = Event()
+
         self.net_worker_list = []
 
         self.is_connected = Event()
@@ -171,6 +181,10 @@ class Session:
                 self.ping_thread = Thread(target=self.ping, name="PingThread")
                 self.ping_thread.start()
 
+                if not self.is_media and self.client.batch_flush_interval:
+                    self.batch_thread = Thread(target=self.batch_worker, name="BatchThread")
+                    self.batch_thread.start()
+
                 log.info("Session initialized: Layer {}".format(layer))
                 log.info("Device: {} - {}".format(self.client.device_model, self.client.app_version))
                 log.info("System: {} ({})".format(self.client.system_version, self.client.lang_code.upper()))
@@ -195,6 +209,7 @@ class Session:
 
         self.ping_thread_event.set()
         self.next_salt_thread_event.set()
+        self.batch_thread_event.set()
 
         if self.ping_thread is not None:
             self.ping_thread.join()
@@ -202,8 +217,13 @@ class Session:
         if self.next_salt_thread is not None:
             self.next_salt_thread.join()
 
+        if self.batch_thread is not None:
+            self.batch_thread.join()
+            self.batch_thread = None
+
         self.ping_thread_event.clear()
         self.next_salt_thread_event.clear()
+        self.batch_thread_event.clear()
 
         self.connection.close()
 
@@ -219,6 +239,12 @@ class Session:
         for i in self.results.values():
             i.event.set()
 
+        with self.batch_lock:
+            # Buffered requests were never sent, their callers have been woken up above and will retry them
+            self.batch, self.batch_bytes = [], 0
+
+        self.batched.clear()
+
         if not self.is_media and callable(self.client.disconnect_handler):
             try:
                 self.client.disconnect_handler(self.client)
@@ -316,6 +342,32 @@ class Session:
                     if msg_id in self.results:
                         self.results[msg_id].value = getattr(msg.body, "result", msg.body)
                         self.results[msg_id].event.set()
+                    elif isinstance(msg.body, (types.BadMsgNotification, types.BadServerSalt)):
+                        # Errors about a whole container are reported against the container msg_id
+                        inner_msg_ids = [k for k, v in list(self.batched.items()) if v == msg_id]
+
+                        if inner_msg_ids:
+                            if isinstance(msg.body, types.BadServerSalt):
+                                self.current_salt = FutureSalt(
+                                    self.current_salt.valid_since,
+                                    self.current_salt.valid_until,
+                                    msg.body.new_server_salt
+                                )
+
+                            is_transient = (
+                                isinstance(msg.body, types.BadServerSalt)
+                                or msg.body.error_code in self.RETRY_BAD_MSG_CODES
+                            )
+
+                            # Leave transient errors without a value, so that send() retries the requests
+                            value = None if is_transient else msg.body
+
+                            for i in inner_msg_ids:
+                                self.batched.pop(i, None)
+
+                                if i in self.results:
+                                    self.results[i].value = value
+                                    self.results[i].event.set()
 
                 if len(self.pending_acks) >= self.ACKS_THRESHOLD:
                     log.info("Send {} acks".format(len(self.pending_acks)))
@@ -380,6 +432,52 @@ class Session:
 
         log.debug("NextSaltThread stopped")
 
+    def batch_worker(self):
+        log.debug("BatchThread started")
+
+        while True:
+            self.batch_thread_event.wait(self.client.batch_flush_interval)
+
+            if self.batch_thread_event.is_set():
+                break
+
+            self.flush()
+
+        log.debug("BatchThread stopped")
+
+    def flush(self):
+        with self.batch_lock:
+            messages, self.batch, self.batch_bytes = self.batch, [], 0
+
+        self.send_batch(messages)
+
+    def send_batch(self, messages: list):
+        if not messages:
+            return
+
+        # Requests buffered within the same flush window are sent together in a single container.
+        # Each of them keeps its own msg_id, so responses are matched back to the waiting callers as usual.
+        if len(messages) == 1:
+            message = messages[0]
+        else:
+            message = self.msg_factory(MsgContainer(messages))
+
+            for i in messages:
+                self.batched[i.msg_id] = message.msg_id
+
+        try:
+            self.connection.send(self.pack(message))
+        except OSError as e:
+            log.warning("Unable to send {} buffered requests: {}".format(len(messages), e))
+
+            # Wake the callers up with no result, they will retry the request
+            for i in messages:
+                self.batched.pop(i.msg_id, None)
+                result = self.results.get(i.msg_id)
+
+                if result is not None:
+                    result.event.set()
+
     def recv(self):
         log.debug("RecvThread started")
 
@@ -399,23 +497,51 @@ class Session:
         log.debug("RecvThread stopped")
 
     def _send(self, data: TLObject, wait_response: bool = True, timeout: float = WAIT_TIMEOUT):
-        message = self.msg_factory(data)
-        msg_id = message.msg_id
+        if wait_response and self.batch_thread is not None:
+            with self.batch_lock:
+                # msg_id and seq_no are assigned under the lock, so that they keep increasing inside the container
+                message = self.msg_factory(data)
+                msg_id = message.msg_id
+                self.results[msg_id] = Result()
 
-        if wait_response:
-            self.results[msg_id] = Result()
+                # 16 = msg_id + seq_no + length of the message inside the container
+                size = message.length + 16
 
-        payload = self.pack(message)
+                # Flush what is already buffered first if this message wouldn't fit in the same container
+                if self.batch_bytes + size > self.MAX_BATCH_BYTES:
+                    pending, self.batch, self.batch_bytes = self.batch, [], 0
+                else:
+                    pending = []
 
-        try:
-            self.connection.send(payload)
-        except OSError as e:
-            self.results.pop(msg_id, None)
-            raise e
+                self.batch.append(message)
+                self.batch_bytes += size
+
+                if len(self.batch) >= self.MAX_BATCH_SIZE or self.batch_bytes >= self.MAX_BATCH_BYTES:
+                    full, self.batch, self.batch_bytes = self.batch, [], 0
+                else:
+                    full = []
+
+            self.send_batch(pending)
+            self.send_batch(full)
+        else:
+            message = self.msg_factory(data)
+            msg_id = message.msg_id
+
+            if wait_response:
+                self.results[msg_id] = Result()
+
+            payload = self.pack(message)
+
+            try:
+                self.connection.send(payload)
+            except OSError as e:
+                self.results.pop(msg_id, None)
+                raise e
 
         if wait_response:
             self.results[msg_id].event.wait(timeout)
             result = self.results.pop(msg_id).value
+            self.batched.pop(msg_id, None)
 
             if result is None:
                 raise TimeoutError